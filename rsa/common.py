@@ -14,11 +14,17 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import sys
+
 from rsa._compat import zip
 
 """Common functionality shared by several modules."""
 
 
+# Python 3.8+ computes modular inverses in C with pow(x, -1, n).
+_HAVE_POW_INVERSE = sys.version_info >= (3, 8)
+
+
 class NotRelativePrimeError(ValueError):
     def __init__(self, a, b, d, msg=None):
         super(NotRelativePrimeError, self).__init__(
@@ -78,7 +84,7 @@ def byte_size(number):
     """
     if number == 0:
         return 1
-    return ceil_div(bit_size(number), 8)
+    return (bit_size(number) + 7) // 8
 
 
 def ceil_div(num, div):
@@ -105,6 +111,23 @@ def ceil_div(num, div):
     return quanta
 
 
+try:
+    # math.gcd() is implemented in C and uses Lehmer's algorithm.
+    from math import gcd
+except ImportError:
+    # Python 2.7
+    def gcd(p, q):
+        """Returns the greatest common divisor of p and q
+
+        >>> gcd(48, 180)
+        12
+        """
+
+        while q != 0:
+            (p, q) = (q, p % q)
+        return p
+
+
 def extended_gcd(a, b):
     """Returns a tuple (r, i, j) such that r = gcd(a, b) = ia + jb
     """
@@ -139,6 +162,13 @@ def inverse(x, n):
     1
     """
 
+    if _HAVE_POW_INVERSE:
+        try:
+            return pow(x, -1, n)
+        except ValueError:
+            # Not invertible; only now is the divider worth computing.
+            raise NotRelativePrimeError(x, n, gcd(x, n))
+
     (divider, inv, _) = extended_gcd(x, n)
 
     if divider != 1:
@@ -167,17 +197,22 @@ def crt(a_values, modulo_values):
     135
     """
 
-    m = 1
-    x = 0
-
-    for modulo in modulo_values:
-        m *= modulo
-
-    for (m_i, a_i) in zip(modulo_values, a_values):
-        M_i = m // m_i
-        inv = inverse(M_i, m_i)
-
-        x = (x + a_i * M_i * inv) % m
+    # Garner's algorithm: x is kept as the solution for the moduli seen so
+    # far, and m as their product. This avoids computing the full product
+    # up front and dividing it by every modulus. Both lists are walked in a
+    # single pass, without slicing off the first element.
+    pairs = zip(modulo_values, a_values)
+    try:
+        (m, a_0) = next(pairs)
+    except StopIteration:
+        # No equations at all; 0 trivially satisfies them.
+        return 0
+    x = a_0 % m
+
+    for (m_i, a_i) in pairs:
+        t = ((a_i - x) * inverse(m, m_i)) % m_i
+        x += t * m
+        m *= m_i
 
     return x
 
@@ -41,7 +41,6 @@ import rsa.prime
 import rsa.pem
 import rsa.common
 import rsa.randnum
-import rsa.core
 
 
 log = logging.getLogger(__name__)
@@ -424,6 +423,23 @@ class PrivateKey(AbstractKey):
                 return blind_r
         raise RuntimeError('unable to find blinding factor')
 
+    def _crt_pow_d(self, value):
+        """Computes value ** d (mod n) using the Chinese Remainder Theorem.
+
+        Two exponentiations modulo p and q with the precomputed exp1 and exp2
+        are considerably cheaper than a single one modulo n. The results are
+        recombined with Garner's formula, using the precomputed coef.
+
+        :param value: the integer to raise to the power d.
+        :type value: int
+        :rtype: int
+        """
+
+        s1 = pow(value, self.exp1, self.p)
+        s2 = pow(value, self.exp2, self.q)
+        h = ((s1 - s2) * self.coef) % self.p
+        return s2 + self.q * h
+
     def blinded_decrypt(self, encrypted):
         """Decrypts the message using blinding to prevent side-channel attacks.
 
@@ -436,7 +452,7 @@ class PrivateKey(AbstractKey):
 
         blind_r = self._get_blinding_factor()
         blinded = self.blind(encrypted, blind_r)  # blind before decrypting
-        decrypted = rsa.core.decrypt_int(blinded, self.d, self.n)
+        decrypted = self._crt_pow_d(blinded)
 
         return self.unblind(decrypted, blind_r)
 
@@ -452,7 +468,7 @@ class PrivateKey(AbstractKey):
 
         blind_r = self._get_blinding_factor()
         blinded = self.blind(message, blind_r)  # blind before encrypting
-        encrypted = rsa.core.encrypt_int(blinded, self.d, self.n)
+        encrypted = self._crt_pow_d(blinded)
         return self.unblind(encrypted, blind_r)
 
     @classmethod
@@ -21,16 +21,58 @@ import base64
 from rsa._compat import is_bytes, range
 
 
+# Cache of _markers() results, keyed by the PEM marker as passed by the caller.
+_markers_cache = {}
+
+
 def _markers(pem_marker):
     """
     Returns the start and end PEM markers, as bytes.
     """
 
-    if not is_bytes(pem_marker):
-        pem_marker = pem_marker.encode('ascii')
+    try:
+        return _markers_cache[pem_marker]
+    except KeyError:
+        pass
+
+    if is_bytes(pem_marker):
+        marker_bytes = pem_marker
+    else:
+        marker_bytes = pem_marker.encode('ascii')
+
+    markers = (b'-----BEGIN ' + marker_bytes + b'-----',
+               b'-----END ' + marker_bytes + b'-----')
+    _markers_cache[pem_marker] = markers
+    return markers
+
+
+def _find_marker_line(contents, marker, start, end):
+    """Finds a marker that is on a line of its own.
+
+    Only whitespace may surround the marker on its line, just like when the
+    lines are stripped and compared to the marker.
+
+    :return: the index of the marker in contents[start:end], or -1 if no such
+        line is found.
+    """
+
+    idx = contents.find(marker, start, end)
+    while idx >= 0:
+        marker_end = idx + len(marker)
+        line_start = max(contents.rfind(b'\n', 0, idx),
+                         contents.rfind(b'\r', 0, idx)) + 1
+        line_ends = [pos for pos in (contents.find(b'\n', marker_end),
+                                     contents.find(b'\r', marker_end))
+                     if pos >= 0]
+        line_end = min(line_ends) if line_ends else len(contents)
+
+        if not contents[line_start:idx].strip() and \
+                not contents[marker_end:line_end].strip():
+            return idx
 
-    return (b'-----BEGIN ' + pem_marker + b'-----',
-            b'-----END ' + pem_marker + b'-----')
+        idx = contents.find(marker, idx + 1, end)
+
+    return -1
 
 
 def load_pem(contents, pem_marker):
@@ -54,46 +96,29 @@ def load_pem(contents, pem_marker):
 
     (pem_start, pem_end) = _markers(pem_marker)
 
-    pem_lines = []
-    in_pem_part = False
-
-    for line in contents.splitlines():
-        line = line.strip()
-
-        # Skip empty lines
-        if not line:
-            continue
-
-        # Handle start marker
-        if line == pem_start:
-            if in_pem_part:
-                raise ValueError('Seen start marker "%s" twice' % pem_start)
-
-            in_pem_part = True
-            continue
+    # Locate the markers with bytes.find(), so that only the lines between
+    # them have to be inspected one by one.
+    marker_idx = _find_marker_line(contents, pem_start, 0, len(contents))
+    if marker_idx < 0:
+        raise ValueError('No PEM start marker "%s" found' % pem_start)
+    body_start = marker_idx + len(pem_start)
 
-        # Skip stuff before first marker
-        if not in_pem_part:
-            continue
+    body_end = _find_marker_line(contents, pem_end, body_start, len(contents))
+    if body_end < 0:
+        raise ValueError('No PEM end marker "%s" found' % pem_end)
 
-        # Handle end marker
-        if in_pem_part and line == pem_end:
-            in_pem_part = False
-            break
+    if _find_marker_line(contents, pem_start, body_start, body_end) >= 0:
+        raise ValueError('Seen start marker "%s" twice' % pem_start)
 
-        # Load fields
-        if b':' in line:
-            continue
+    body = contents[body_start:body_end]
 
-        pem_lines.append(line)
+    # Skip empty lines and header fields
+    pem_lines = [line for line in (line.strip() for line in body.splitlines())
+                 if line and b':' not in line]
 
-    # Do some sanity checks
     if not pem_lines:
         raise ValueError('No PEM start marker "%s" found' % pem_start)
 
-    if in_pem_part:
-        raise ValueError('No PEM end marker "%s" found' % pem_end)
-
     # Base64-decode the contents
     pem = b''.join(pem_lines)
     return base64.standard_b64decode(pem)
@@ -113,14 +138,10 @@ def save_pem(contents, pem_marker):
 
     (pem_start, pem_end) = _markers(pem_marker)
 
-    b64 = base64.standard_b64encode(contents).replace(b'\n', b'')
-    pem_lines = [pem_start]
-
-    for block_start in range(0, len(b64), 64):
-        block = b64[block_start:block_start + 64]
-        pem_lines.append(block)
-
-    pem_lines.append(pem_end)
-    pem_lines.append(b'')
+    # standard_b64encode() never inserts newlines, so we can cut it directly
+    # into lines of 64 characters.
+    b64 = base64.standard_b64encode(contents)
+    pem_lines = [b64[block_start:block_start + 64]
+                 for block_start in range(0, len(b64), 64)]
 
-    return b'\n'.join(pem_lines)
+    return b'\n'.join([pem_start] + pem_lines + [pem_end, b''])
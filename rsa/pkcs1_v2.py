@@ -20,11 +20,12 @@ This module implements certain functionality from PKCS#1 version 2. Main
 documentation is RFC 2437: https://tools.ietf.org/html/rfc2437
 """
 
+from struct import pack
+
 from rsa._compat import range
 from rsa import (
     common,
     pkcs1,
-    transform,
 )
 
 
@@ -71,10 +72,12 @@ def mgf1(seed, length, hasher='SHA-1'):
 
     # Looping `counter` from 0 to ceil(l / hLen)-1, build `output` based on the
     # hashes formed by (`seed` + C), being `C` an octet string of length 4
-    # generated by converting `counter` with the primitive I2OSP
+    # generated by converting `counter` with the primitive I2OSP. As `C` is
+    # always a 4-octet big-endian unsigned integer, struct can produce it
+    # directly for every block.
     output = b''.join(
         pkcs1.compute_hash(
-            seed + transform.int2bytes(counter, fill_size=4),
+            seed + pack('>I', counter),
             method_name=hasher,
         )
         for counter in range(common.ceil_div(length, hash_length) + 1)
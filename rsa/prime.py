@@ -21,22 +21,23 @@ Roberto Tamassia, 2002.
 """
 
 from rsa._compat import range
+from rsa.common import gcd
 import rsa.common
 import rsa.randnum
 
 __all__ = ['getprime', 'are_relatively_prime']
 
-
-def gcd(p, q):
-    """Returns the greatest common divisor of p and q
-
-    >>> gcd(48, 180)
-    12
-    """
-
-    while q != 0:
-        (p, q) = (q, p % q)
-    return p
+# Odd primes below 542, used to cheaply weed out most composite candidates
+# before running Miller-Rabin.
+_SMALL_PRIMES = (
+    3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71,
+    73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131, 137, 139, 149, 151,
+    157, 163, 167, 173, 179, 181, 191, 193, 197, 199, 211, 223, 227, 229, 233,
+    239, 241, 251, 257, 263, 269, 271, 277, 281, 283, 293, 307, 311, 313, 317,
+    331, 337, 347, 349, 353, 359, 367, 373, 379, 383, 389, 397, 401, 409, 419,
+    421, 431, 433, 439, 443, 449, 457, 461, 463, 467, 479, 487, 491, 499, 503,
+    509, 521, 523, 541,
+)
 
 
 def get_primality_testing_rounds(number):
@@ -85,22 +86,27 @@ def miller_rabin_primality_testing(n, k):
     if n < 2:
         return False
 
+    # Computed once, as it is compared against in every witness round.
+    n_minus_1 = n - 1
+
     # Decompose (n - 1) to write it as (2 ** r) * d
-    # While d is even, divide it by 2 and increase the exponent.
-    d = n - 1
-    r = 0
+    # The lowest set bit of (n - 1) gives r; shift all those zeros out at once.
+    d = n_minus_1
+    r = (d & -d).bit_length() - 1
+    d >>= r
 
-    while not (d & 1):
-        r += 1
-        d >>= 1
+    # Look these up once rather than in every round. randint is resolved at
+    # call time, so that it can still be replaced for testing.
+    randint = rsa.randnum.randint
+    n_minus_3 = n - 3
 
     # Test k witnesses.
     for _ in range(k):
         # Generate random integer a, where 2 <= a <= (n - 2)
-        a = rsa.randnum.randint(n - 3) + 1
+        a = randint(n_minus_3) + 1
 
         x = pow(a, d, n)
-        if x == 1 or x == n - 1:
+        if x == 1 or x == n_minus_1:
             continue
 
         for _ in range(r - 1):
@@ -108,7 +114,7 @@ def miller_rabin_primality_testing(n, k):
             if x == 1:
                 # n is composite.
                 return False
-            if x == n - 1:
+            if x == n_minus_1:
                 # Exit inner loop and continue with next witness.
                 break
         else:
@@ -137,6 +143,12 @@ def is_prime(number):
     if not (number & 1):
         return False
 
+    # Trial division by small primes is much cheaper than a modular
+    # exponentiation, and rejects the vast majority of composites.
+    for prime in _SMALL_PRIMES:
+        if number % prime == 0:
+            return number == prime
+
     # Calculate minimum number of rounds.
     k = get_primality_testing_rounds(number)
 
@@ -182,6 +194,12 @@ def are_relatively_prime(a, b):
     False
     """
 
+    # Cheap answers that don't need a full gcd.
+    if not (a & 1) and not (b & 1):
+        return False
+    if a == 1 or b == 1:
+        return True
+
     d = gcd(a, b)
     return d == 1
 
@@ -22,10 +22,9 @@ From bytes to a number, number to bytes, etc.
 from __future__ import absolute_import
 
 import binascii
-from struct import pack
 
-from rsa._compat import byte, is_integer
-from rsa import common, machine_size
+from rsa._compat import PY2, byte, is_integer
+from rsa import common
 
 
 def bytes2int(raw_bytes):
@@ -40,7 +39,9 @@ def bytes2int(raw_bytes):
 
     """
 
-    return int(binascii.hexlify(raw_bytes), 16)
+    if PY2:
+        return int(binascii.hexlify(raw_bytes), 16)
+    return int.from_bytes(raw_bytes, 'big', signed=False)
 
 
 def _int2bytes(number, block_size=None):
@@ -177,36 +178,26 @@ def int2bytes(number, fill_size=None, chunk_size=None, overflow=False):
     # Ensure these are integers.
     number & 1
 
-    raw_bytes = b''
-
-    # Pack the integer one machine word at a time into bytes.
-    num = number
-    word_bits, _, max_uint, pack_type = machine_size.get_word_alignment(num)
-    pack_format = ">%s" % pack_type
-    while num > 0:
-        raw_bytes = pack(pack_format, num & max_uint) + raw_bytes
-        num >>= word_bits
-    # Obtain the index of the first non-zero byte.
-    zero_leading = bytes_leading(raw_bytes)
-    if number == 0:
-        raw_bytes = b'\x00'
-    # De-padding.
-    raw_bytes = raw_bytes[zero_leading:]
-
-    length = len(raw_bytes)
+    # The bit length is read once and used for both the bounds checking and
+    # the conversion. Zero still takes up one byte.
+    length = (number.bit_length() + 7) // 8 or 1
     if fill_size and fill_size > 0:
         if not overflow and length > fill_size:
             raise OverflowError(
                     "Need %d bytes for number, but fill size is %d" %
                     (length, fill_size)
             )
-        raw_bytes = raw_bytes.rjust(fill_size, b'\x00')
+        length = max(length, fill_size)
     elif chunk_size and chunk_size > 0:
         remainder = length % chunk_size
         if remainder:
-            padding_size = chunk_size - remainder
-            raw_bytes = raw_bytes.rjust(length + padding_size, b'\x00')
-    return raw_bytes
+            length += chunk_size - remainder
+
+    # Let the interpreter serialise the whole number (including the zero
+    # padding) in one go, rather than packing it word by word.
+    if PY2:
+        return binascii.unhexlify('%0*x' % (2 * length, number))
+    return number.to_bytes(length, 'big')
 
 
 if __name__ == '__main__':
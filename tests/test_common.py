@@ -18,7 +18,7 @@
 import unittest
 import struct
 from rsa._compat import byte
-from rsa.common import byte_size, bit_size, inverse
+from rsa.common import byte_size, bit_size, crt, inverse, NotRelativePrimeError
 
 
 class TestByte(unittest.TestCase):
@@ -94,3 +94,30 @@ class TestInverse(unittest.TestCase):
     def test_not_relprime(self):
         self.assertRaises(ValueError, inverse, 4, 8)
         self.assertRaises(ValueError, inverse, 25, 5)
+
+    def test_not_relprime_divider(self):
+        with self.assertRaises(NotRelativePrimeError) as ctx:
+            inverse(12, 18)
+        self.assertEqual(6, ctx.exception.d)
+
+
+class TestCrt(unittest.TestCase):
+    def test_values(self):
+        self.assertEqual(8, crt([2, 3], [3, 5]))
+        self.assertEqual(23, crt([2, 3, 2], [3, 5, 7]))
+        self.assertEqual(135, crt([2, 3, 0], [7, 11, 15]))
+
+    def test_empty(self):
+        self.assertEqual(0, crt([], []))
+
+    def test_iterables(self):
+        self.assertEqual(23, crt(iter([2, 3, 2]), (m for m in [3, 5, 7])))
+
+    def test_single_modulus(self):
+        self.assertEqual(3, crt([10], [7]))
+
+    def test_residues_larger_than_moduli(self):
+        self.assertEqual(8, crt([5, 13], [3, 5]))
+
+    def test_not_relprime(self):
+        self.assertRaises(ValueError, crt, [1, 2], [4, 6])
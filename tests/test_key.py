@@ -27,6 +27,18 @@ class BlindingTest(unittest.TestCase):
 
         self.assertEqual(unblinded, message)
 
+    def test_blinded_decrypt_uses_crt(self):
+        """The CRT-based private operation must match plain exponentiation."""
+
+        pk = rsa.key.PrivateKey(3727264081, 65537, 3349121513, 65063, 57287)
+
+        message = 12345
+        encrypted = rsa.core.encrypt_int(message, pk.e, pk.n)
+        self.assertEqual(pk.blinded_decrypt(encrypted), message)
+
+        signed = pk.blinded_encrypt(message)
+        self.assertEqual(signed, rsa.core.encrypt_int(message, pk.d, pk.n))
+
 
 class KeyGenTest(unittest.TestCase):
     def test_custom_exponent(self):
@@ -31,13 +31,10 @@ class BinaryTest(unittest.TestCase):
 
     def test_enc_dec(self):
         message = struct.pack('>IIII', 0, 0, 0, 1)
-        print("\tMessage:   %r" % message)
 
         encrypted = pkcs1.encrypt(message, self.pub)
-        print("\tEncrypted: %r" % encrypted)
 
         decrypted = pkcs1.decrypt(encrypted, self.priv)
-        print("\tDecrypted: %r" % decrypted)
 
         self.assertEqual(message, decrypted)
 
@@ -19,6 +19,7 @@
 import unittest
 
 from rsa._compat import range
+import rsa.common
 import rsa.prime
 import rsa.randnum
 
@@ -41,6 +42,11 @@ class PrimeTest(unittest.TestCase):
             [x for x in range(901, 1000) if rsa.prime.is_prime(x)]
         )
 
+        # Test numbers around the small primes used for trial division.
+        self.assertTrue(rsa.prime.is_prime(541))
+        self.assertFalse(rsa.prime.is_prime(541 * 547))
+        self.assertFalse(rsa.prime.is_prime(3 * 982451653))
+
         # Test around the 50th millionth known prime.
         self.assertTrue(rsa.prime.is_prime(982451653))
         self.assertFalse(rsa.prime.is_prime(982451653 * 961748941))
@@ -95,6 +101,24 @@ class PrimeTest(unittest.TestCase):
         for exp in known_mersenne_exponents:
             self.assertTrue(rsa.prime.is_prime(2**exp - 1))
 
+    def test_getprime(self):
+        """Tests prime generation for small and larger bit sizes."""
+
+        for nbits in (4, 10, 11, 64, 256):
+            prime = rsa.prime.getprime(nbits)
+            self.assertEqual(nbits, rsa.common.bit_size(prime))
+            self.assertTrue(rsa.prime.is_prime(prime))
+
+    def test_are_relatively_prime(self):
+        self.assertTrue(rsa.prime.are_relatively_prime(1, 1))
+        self.assertTrue(rsa.prime.are_relatively_prime(1, 8))
+        self.assertTrue(rsa.prime.are_relatively_prime(8, 1))
+        self.assertTrue(rsa.prime.are_relatively_prime(65537, 982451652))
+        self.assertTrue(rsa.prime.are_relatively_prime(9, 16))
+        self.assertFalse(rsa.prime.are_relatively_prime(0, 0))
+        self.assertFalse(rsa.prime.are_relatively_prime(6, 8))
+        self.assertFalse(rsa.prime.are_relatively_prime(9, 15))
+
     def test_get_primality_testing_rounds(self):
         """Test round calculation for primality testing."""
 
@@ -37,6 +37,14 @@ class Test_int2bytes(unittest.TestCase):
         self.assertEqual(_int2bytes(123456789, 7),
                          b'\x00\x00\x00\x07[\xcd\x15')
 
+    def test_chunk_size_keyword(self):
+        self.assertEqual(int2bytes(123456789, chunk_size=3),
+                         b'\x00\x00\x07[\xcd\x15')
+        self.assertEqual(int2bytes(123456789, chunk_size=4), b'\x07[\xcd\x15')
+
+    def test_overflow_allowed(self):
+        self.assertEqual(int2bytes(123456789, 3, overflow=True), b'\x07[\xcd\x15')
+
     def test_zero(self):
         self.assertEqual(int2bytes(0, 4), b'\x00' * 4)
         self.assertEqual(int2bytes(0, 7), b'\x00' * 7)